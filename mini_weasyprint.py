@@ -17,14 +17,92 @@ Mini WeasyPrint - 경량 HTML to PDF 변환기
     converter.html_to_pdf('<h1>Hello World!</h1>', 'output.pdf')
 """
 
+import os
 import re
 import sys
 import argparse
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
+from typing import ClassVar
 import base64
 
+# 자주 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_RULE_RE = re.compile(r'([^{}]+)\s*\{([^{}]+)\}')
+# 태그 분류는 리스트 검색 대신 O(1) 집합 조회로 처리
+_VOID_TAGS = frozenset({'br', 'hr', 'img', 'input', 'meta', 'link'})
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+# 내장 파서에 한 번에 공급하는 입력 크기 (64KB)
+_FEED_CHUNK_SIZE = 65536
+
+def _parse_declaration_offsets(buf):
+    """선언 바이트열에서 (속성 시작, 속성 끝, 값 시작, 값 끝) 오프셋 추출
+
+    ';'와 ':'를 기준으로 수동 분할한다. numba가 설치되어 있으면
+    아래에서 JIT 컴파일되어 대형 스타일시트에서 큰 폭으로 빨라진다.
+    """
+    spans = []
+    start = 0
+    n = len(buf)
+    for i in range(n + 1):
+        if i == n or buf[i] == 59:  # ';'
+            colon = -1
+            for j in range(start, i):
+                if buf[j] == 58:  # ':'
+                    colon = j
+                    break
+            if colon >= 0:
+                spans.append((start, colon, colon + 1, i))
+            start = i + 1
+    return spans
+
+
+# numba가 있으면 선언 파싱 루프를 JIT 컴파일
+try:
+    import numba
+    _parse_declaration_offsets = numba.njit(cache=True)(_parse_declaration_offsets)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _parse_declarations(declarations):
+    """선언 문자열을 (속성, 값) 쌍 목록으로 파싱"""
+    if NUMBA_AVAILABLE:
+        # ';'/':'는 UTF-8 멀티바이트 안에 나타나지 않으므로 바이트 단위 분할이 안전
+        buf = declarations.encode('utf-8')
+        return [
+            (buf[a:b].decode('utf-8').strip(), buf[c:d].decode('utf-8').strip())
+            for a, b, c, d in _parse_declaration_offsets(buf)
+        ]
+
+    pairs = []
+    for decl in declarations.split(';'):
+        if ':' in decl:
+            prop, value = decl.split(':', 1)
+            pairs.append((prop.strip(), value.strip()))
+    return pairs
+
+
+# 일괄 변환에서 파일 읽기를 비동기로 처리 (없으면 스레드로 대체)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# 가능하면 C 확장 파서(selectolax)를 사용하고, 없으면 내장 html.parser 사용
+try:
+    from selectolax.parser import HTMLParser as _FastHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 try:
     from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import letter, A4
@@ -41,37 +119,88 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     print("경고: reportlab이 설치되지 않았습니다. 설치하려면: pip install reportlab")
 
+@functools.cache
+def _sample_styles_singleton():
+    """reportlab 기본 스타일 시트 (프로세스당 한 번만 생성)"""
+    return getSampleStyleSheet()
+
+
+# 윈도우 시스템 한글 폰트 후보 (우선순위 순)
+_FONT_CANDIDATES = (
+    (r"C:\Windows\Fonts\malgun.ttf", '맑은 고딕'),
+    (r"C:\Windows\Fonts\gulim.ttc", '굴림'),
+    (r"C:\Windows\Fonts\batang.ttc", '바탕'),
+    (r"C:\Windows\Fonts\NanumGothic.ttf", '나눔고딕'),
+)
+
+
+@functools.cache
+def _register_korean_fonts_once(verbose=False):
+    """한글 폰트를 프로세스당 한 번만 등록하고 성공 여부 반환"""
+    if not REPORTLAB_AVAILABLE:
+        return False
+
+    for font_path, label in _FONT_CANDIDATES:
+        if not os.path.isfile(font_path):
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
+        except Exception as e:
+            if verbose:
+                print(f"폰트 등록 실패 {font_path}: {e}")
+            continue
+        if verbose:
+            print(f"한글 폰트 등록 성공: {label} ({font_path})")
+        return True
+
+    if verbose:
+        print("경고: 한글 폰트를 찾을 수 없습니다. 한글이 제대로 표시되지 않을 수 있습니다.")
+        print("해결 방법: 나눔폰트나 다른 한글 TTF 폰트를 시스템에 설치하세요.")
+    return False
+
+
 class CSSParser:
     """간단한 CSS 파서"""
     
     def __init__(self):
         self.styles = {}
-    
+        # (tag, class, id) 조합별로 병합된 스타일을 캐시
+        self._style_cache = {}
+
     def parse_css(self, css_text):
         """CSS 텍스트를 파싱하여 스타일 딕셔너리 생성"""
         # CSS 주석 제거
-        css_text = re.sub(r'/\*.*?\*/', '', css_text, flags=re.DOTALL)
-        
+        css_text = _CSS_COMMENT_RE.sub('', css_text)
+
         # CSS 규칙 추출
-        rules = re.findall(r'([^{}]+)\s*\{([^{}]+)\}', css_text)
+        rules = _CSS_RULE_RE.findall(css_text)
         
         for selector, declarations in rules:
             selector = selector.strip()
-            style_dict = {}
-            
+
             # 선언 파싱
-            declarations = declarations.split(';')
-            for decl in declarations:
-                if ':' in decl:
-                    prop, value = decl.split(':', 1)
-                    style_dict[prop.strip()] = value.strip()
-            
+            style_dict = dict(_parse_declarations(declarations))
+
             self.styles[selector] = style_dict
-        
+
+        # 스타일이 바뀌었으므로 캐시 무효화
+        self._style_cache.clear()
+
         return self.styles
-    
+
     def get_style(self, tag, class_name=None, tag_id=None):
-        """태그에 해당하는 스타일 반환"""
+        """태그에 해당하는 스타일 반환 (조합별로 캐시)"""
+        key = (tag, class_name, tag_id)
+        cached = self._style_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        style = self._compute_style(tag, class_name, tag_id)
+        self._style_cache[key] = style
+        return dict(style)
+
+    def _compute_style(self, tag, class_name, tag_id):
+        """태그/클래스/ID 스타일을 병합"""
         style = {}
         
         # 태그 스타일
@@ -93,8 +222,16 @@ class CSSParser:
         return style
 
 class HTMLElement:
-    """HTML 요소를 표현하는 클래스"""
-    
+    """HTML 요소를 표현하는 클래스
+
+    큰 문서는 수천 개의 노드를 만들므로 인스턴스 __dict__ 대신
+    __slots__를 사용해 노드당 메모리를 줄인다.
+    (서브클래스도 __slots__를 다시 선언해야 효과가 유지된다.)
+    """
+
+    __slots__ = ('attrs', 'children', 'content', 'has_text', 'parent',
+                 'style', 'tag')
+
     def __init__(self, tag, attrs=None, content=''):
         self.tag = tag
         self.attrs = attrs or {}
@@ -102,60 +239,135 @@ class HTMLElement:
         self.children = []
         self.parent = None
         self.style = {}
+        # 서브트리에 보이는 출력(텍스트, <br>, <hr>)이 있는지 여부.
+        # 파서가 상향 전파하며, story 생성 시 빈 래퍼를 건너뛰는 데 쓴다.
+        self.has_text = False
     
     def add_child(self, child):
         child.parent = self
         self.children.append(child)
+
+    def mark_has_text(self):
+        """이 노드부터 조상 방향으로 has_text 전파 (이미 표시되면 중단)"""
+        node = self
+        while node is not None and not node.has_text:
+            node.has_text = True
+            node = node.parent
     
     def get_text(self):
         """요소의 모든 텍스트 반환"""
-        text = self.content
-        for child in self.children:
-            text += child.get_text()
-        return text
+        # 깊은 트리에서 재귀 한계와 문자열 반복 연결을 피하기 위해
+        # 명시적 스택으로 전위 순회. 텍스트 자식은 일반 str이다.
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            parts.append(node.content)
+            stack.extend(reversed(node.children))
+        return ''.join(parts)
 
 class MiniHTMLParser(HTMLParser):
     """경량 HTML 파서"""
-    
-    def __init__(self):
+
+    def __init__(self, css_parser=None):
         super().__init__()
+        self.css_parser = css_parser
+        self.reset_document()
+
+    def reset_document(self):
+        """다음 파싱을 위해 문서 트리와 내부 상태 초기화
+
+        호출마다 새 파서를 할당하지 않고 인스턴스를 재사용할 수 있다.
+        """
         self.document = HTMLElement('document')
         self.current_element = self.document
         self.element_stack = [self.document]
+        self._pending_data = []
+        super().reset()
+
+    def _flush_data(self):
+        """누적된 문자 데이터를 하나의 텍스트 자식으로 확정
+
+        feed()를 조각 단위로 호출하면 하나의 텍스트 런이 여러 번의
+        handle_data로 쪼개져 들어오므로, 태그 경계를 만날 때까지
+        원본 그대로 모았다가 한 번만 strip해 이어 붙인다.
+        """
+        if self._pending_data:
+            data = ''.join(self._pending_data).strip()
+            self._pending_data.clear()
+            if data:
+                self.current_element.children.append(data)
+                self.current_element.mark_has_text()
     
     def handle_starttag(self, tag, attrs):
+        self._flush_data()
+        # 같은 태그명은 하나의 문자열 객체를 공유하도록 intern
+        tag = sys.intern(tag)
         attrs_dict = dict(attrs)
         element = HTMLElement(tag, attrs_dict)
         self.current_element.add_child(element)
-        
+
+        # <br>/<hr>도 보이는 출력을 만들므로 서브트리 표시
+        if tag == 'br' or tag == 'hr':
+            element.mark_has_text()
+
         # 자체 닫는 태그가 아닌 경우 스택에 추가
-        if tag not in ['br', 'hr', 'img', 'input', 'meta', 'link']:
+        if tag not in _VOID_TAGS:
             self.element_stack.append(element)
             self.current_element = element
     
     def handle_endtag(self, tag):
+        self._flush_data()
         if len(self.element_stack) > 1 and self.current_element.tag == tag:
             self.element_stack.pop()
             self.current_element = self.element_stack[-1]
     
     def handle_data(self, data):
-        if data.strip():
-            text_element = HTMLElement('text', content=data.strip())
-            self.current_element.add_child(text_element)
+        if self.current_element.tag == 'style':
+            # <style> 내용은 DOM 노드를 만들지 않고 바로 CSS 파서에 전달
+            if self.css_parser is not None:
+                self.css_parser.parse_css(data)
+            return
+        # 텍스트는 전체 HTMLElement 대신 일반 str로 저장 (가장 많이
+        # 생성되는 노드라 메모리 절감 효과가 크다). 청크 경계에서
+        # 쪼개진 런을 합치기 위해 태그 경계까지 버퍼에 모은다.
+        self._pending_data.append(data)
+
+    # 주석/처리 지시문/선언도 런을 끊는 경계다. 여기서도 flush해야
+    # C 파서 경로와 같은 위치에서 텍스트가 확정된다.
+    def handle_comment(self, data):
+        self._flush_data()
+
+    def handle_pi(self, data):
+        self._flush_data()
+
+    def handle_decl(self, decl):
+        self._flush_data()
+
+    def close(self):
+        super().close()
+        self._flush_data()
 
 class MiniWeasyPrint:
     """경량 WeasyPrint 메인 클래스"""
     
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.css_parser = CSSParser()
-        self.html_parser = MiniHTMLParser()
+        self.html_parser = MiniHTMLParser(self.css_parser)
         self.page_size = A4
         self.margin = 72  # 1인치
-        self.korean_font_registered = False
-        
-        # 한글 폰트 등록 시도
-        self._register_korean_fonts()
-        
+
+        # SimpleDocTemplate 인자는 페이지 설정이 바뀔 때만 재계산
+        self._doc_kwargs = None
+        self._doc_kwargs_key = None
+
+        # 한글 폰트 등록은 프로세스당 한 번만 수행
+        self.korean_font_registered = _register_korean_fonts_once(verbose)
+
+
         # 기본 스타일
         font_name = 'NanumGothic' if self.korean_font_registered else 'Helvetica'
         self.default_styles = {
@@ -170,185 +382,239 @@ class MiniWeasyPrint:
             'span': {'font-size': '12pt', 'font-name': font_name},
         }
     
-    def _register_korean_fonts(self):
-        """한글 폰트 등록"""
-        if not REPORTLAB_AVAILABLE:
-            return
-        
-        # 윈도우 시스템 폰트 경로들
-        windows_font_paths = [
-            r"C:\Windows\Fonts\malgun.ttf",      # 맑은 고딕
-            r"C:\Windows\Fonts\gulim.ttc",       # 굴림
-            r"C:\Windows\Fonts\batang.ttc",      # 바탕
-            r"C:\Windows\Fonts\NanumGothic.ttf", # 나눔고딕 (있다면)
-        ]
-        
-        for font_path in windows_font_paths:
-            if os.path.exists(font_path):
-                try:
-                    if font_path.endswith('malgun.ttf'):
-                        pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                        print(f"한글 폰트 등록 성공: 맑은 고딕 ({font_path})")
-                        self.korean_font_registered = True
-                        break
-                    elif font_path.endswith('gulim.ttc'):
-                        pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                        print(f"한글 폰트 등록 성공: 굴림 ({font_path})")
-                        self.korean_font_registered = True
-                        break
-                    elif font_path.endswith('batang.ttc'):
-                        pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                        print(f"한글 폰트 등록 성공: 바탕 ({font_path})")
-                        self.korean_font_registered = True
-                        break
-                    elif font_path.endswith('NanumGothic.ttf'):
-                        pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                        print(f"한글 폰트 등록 성공: 나눔고딕 ({font_path})")
-                        self.korean_font_registered = True
-                        break
-                except Exception as e:
-                    print(f"폰트 등록 실패 {font_path}: {e}")
-                    continue
-        
-        if not self.korean_font_registered:
-            print("경고: 한글 폰트를 찾을 수 없습니다. 한글이 제대로 표시되지 않을 수 있습니다.")
-            print("해결 방법: 나눔폰트나 다른 한글 TTF 폰트를 시스템에 설치하세요.")
-    
     def parse_html(self, html_content):
-        """HTML 파싱"""
-        # CSS 추출
-        css_matches = re.findall(r'<style[^>]*>(.*?)</style>', html_content, re.DOTALL | re.IGNORECASE)
-        for css in css_matches:
-            self.css_parser.parse_css(css)
-        
-        # HTML 파싱
-        self.html_parser = MiniHTMLParser()
-        self.html_parser.feed(html_content)
-        
+        """HTML 파싱 (CSS는 같은 순회에서 함께 추출)"""
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_html_fast(html_content)
+
+        self.html_parser.reset_document()
+        # 문서 전체를 한 번에 넘기지 않고 고정 크기 조각으로 공급해
+        # 토크나이저 내부 버퍼가 커지는 것을 막는다
+        for i in range(0, len(html_content), _FEED_CHUNK_SIZE):
+            self.html_parser.feed(html_content[i:i + _FEED_CHUNK_SIZE])
+        self.html_parser.close()
+
         return self.html_parser.document
+
+    def _parse_html_fast(self, html_content):
+        """selectolax(C 확장)로 파싱한 트리를 HTMLElement 트리로 변환
+
+        내장 파서와 같은 구조를 만든다: 텍스트 자식은 일반 str로
+        표현되고, 루트는 'document' 요소다.
+        """
+        document = HTMLElement('document')
+        root = _FastHTMLParser(html_content).root
+        if root is None:
+            return document
+
+        stack = [(root, document)]
+        while stack:
+            node, parent = stack.pop()
+            tag = node.tag
+
+            if tag == '-text':
+                text = node.text_content
+                if text and text.strip():
+                    parent.children.append(text.strip())
+                    parent.mark_has_text()
+                continue
+            if tag in ('-comment', '_comment'):
+                continue
+
+            element = HTMLElement(sys.intern(tag), node.attributes or {})
+            parent.add_child(element)
+            if tag == 'br' or tag == 'hr':
+                element.mark_has_text()
+
+            if tag == 'style':
+                # <style> 내용은 DOM으로 만들지 않고 바로 CSS 파서에 전달
+                css_text = node.text(deep=True)
+                if css_text:
+                    self.css_parser.parse_css(css_text)
+                continue
+
+            for child in reversed(list(node.iter(include_text=True))):
+                stack.append((child, element))
+
+        return document
     
     def apply_styles(self, element):
-        """요소에 스타일 적용"""
-        # 기본 스타일
-        if element.tag in self.default_styles:
-            element.style.update(self.default_styles[element.tag])
-        
-        # CSS 스타일
-        class_name = element.attrs.get('class')
-        element_id = element.attrs.get('id')
-        css_style = self.css_parser.get_style(element.tag, class_name, element_id)
-        element.style.update(css_style)
-        
-        # 자식 요소에도 재귀적으로 적용
-        for child in element.children:
-            self.apply_styles(child)
+        """요소(와 모든 자식)에 스타일 적용"""
+        # 재귀 대신 명시적 스택으로 순회
+        stack = [element]
+        while stack:
+            element = stack.pop()
+
+            # 기본 스타일
+            if element.tag in self.default_styles:
+                element.style.update(self.default_styles[element.tag])
+
+            # CSS 스타일
+            class_name = element.attrs.get('class')
+            element_id = element.attrs.get('id')
+            css_style = self.css_parser.get_style(element.tag, class_name, element_id)
+            element.style.update(css_style)
+
+            # 텍스트 자식(str)은 스타일 대상이 아님
+            stack.extend(child for child in reversed(element.children)
+                         if not isinstance(child, str))
     
-    def create_pdf_content(self, document, pdf_canvas):
-        """PDF 내용 생성"""
+    def _make_doc(self, output_path):
+        """현재 페이지 설정으로 SimpleDocTemplate 생성
+
+        같은 설정으로 반복 변환하는 서버 워크로드를 위해 여백 계산
+        인자를 (page_size, margin) 키로 캐시해 재사용한다.
+        """
+        key = (self.page_size, self.margin)
+        if key != self._doc_kwargs_key:
+            self._doc_kwargs = {
+                'pagesize': self.page_size,
+                'rightMargin': self.margin,
+                'leftMargin': self.margin,
+                'topMargin': self.margin,
+                'bottomMargin': self.margin,
+            }
+            self._doc_kwargs_key = key
+        return SimpleDocTemplate(output_path, **self._doc_kwargs)
+
+    def create_pdf_content(self, document):
+        """문서 트리로부터 PDF story 생성"""
         if not REPORTLAB_AVAILABLE:
             raise ImportError("reportlab이 필요합니다: pip install reportlab")
-        
-        # SimpleDocTemplate 사용하여 문서 생성
-        doc = SimpleDocTemplate(
-            "temp.pdf",
-            pagesize=self.page_size,
-            rightMargin=self.margin,
-            leftMargin=self.margin,
-            topMargin=self.margin,
-            bottomMargin=self.margin
-        )
-        
+
         # 스타일 시트
-        styles = getSampleStyleSheet()
+        styles = _sample_styles_singleton()
+        korean_styles = self._build_korean_styles(styles)
         story = []
-        
-        self._add_elements_to_story(document, story, styles)
-        
+
+        self._add_elements_to_story(document, story, styles, korean_styles)
+
         return story
     
-    def _add_elements_to_story(self, element, story, styles):
+    def _build_korean_styles(self, styles):
+        """한글 폰트용 ParagraphStyle을 미리 생성
+
+        노드마다 ParagraphStyle을 새로 만들지 않도록 문서 변환당
+        한 번만 만들어 이름으로 조회한다.
+        """
+        if not self.korean_font_registered:
+            return {}
+
+        korean_styles = {}
+        for level in range(1, 7):
+            style_name = f'Heading{level}'
+            base = styles[style_name]
+            korean_styles[style_name] = ParagraphStyle(
+                name=f'Korean{style_name}',
+                parent=base,
+                fontName='NanumGothic',
+                fontSize=base.fontSize,
+                leading=base.fontSize * 1.2
+            )
+        korean_styles['Normal'] = ParagraphStyle(
+            name='KoreanNormal',
+            parent=styles['Normal'],
+            fontName='NanumGothic',
+            fontSize=12,
+            leading=14
+        )
+        return korean_styles
+
+    def _add_elements_to_story(self, element, story, styles, korean_styles):
         """요소를 PDF story에 추가"""
-        if element.tag == 'text':
-            # 텍스트 요소는 부모 컨텍스트에서 처리
-            return element.content
-        
-        elif element.tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            # 헤더 요소
-            level = int(element.tag[1])
-            style_name = f'Heading{level}' if level <= 6 else 'Heading6'
-            text = self._get_element_text(element)
-            if text:
-                # 한글 폰트가 등록된 경우 스타일 수정
-                if self.korean_font_registered:
-                    korean_style = ParagraphStyle(
-                        name=f'Korean{style_name}',
-                        parent=styles[style_name],
-                        fontName='NanumGothic',
-                        fontSize=styles[style_name].fontSize,
-                        leading=styles[style_name].fontSize * 1.2
-                    )
-                    para = Paragraph(text, korean_style)
-                else:
-                    para = Paragraph(text, styles[style_name])
-                story.append(para)
-                story.append(Spacer(1, 12))
-        
-        elif element.tag == 'p':
-            # 단락 요소
-            text = self._get_element_text(element)
-            if text:
-                # 한글 폰트가 등록된 경우 스타일 수정
-                if self.korean_font_registered:
-                    korean_style = ParagraphStyle(
-                        name='KoreanNormal',
-                        parent=styles['Normal'],
-                        fontName='NanumGothic',
-                        fontSize=12,
-                        leading=14
-                    )
-                    para = Paragraph(text, korean_style)
-                else:
-                    para = Paragraph(text, styles['Normal'])
-                story.append(para)
-                story.append(Spacer(1, 6))
-        
-        elif element.tag == 'br':
-            # 줄바꿈
-            story.append(Spacer(1, 12))
-        
-        elif element.tag == 'hr':
-            # 수평선
-            story.append(Spacer(1, 6))
-            # 간단한 선 그리기 (reportlab의 다른 방법 필요)
-            story.append(Spacer(1, 6))
-        
+        # 깊은 문서에서도 재귀 한계에 걸리지 않도록 스택으로 순회
+        stack = [element]
+        while stack:
+            element = stack.pop()
+            self._add_element_to_story(element, story, styles, korean_styles, stack)
+
+    def _add_element_to_story(self, element, story, styles, korean_styles, stack):
+        """단일 요소를 story에 추가 (컨테이너면 자식을 stack에 적재)"""
+        if not element.has_text:
+            # 보이는 출력이 전혀 없는 서브트리는 통째로 건너뜀
+            return
+
+        # if/elif 연쇄 대신 태그별 핸들러를 O(1) 딕셔너리 조회
+        handler = self._HANDLERS.get(element.tag)
+        if handler is not None:
+            handler(self, element, story, styles, korean_styles)
         else:
             # 기타 요소는 자식 요소들을 처리
-            for child in element.children:
-                self._add_elements_to_story(child, story, styles)
+            # (텍스트 자식(str)은 부모 컨텍스트에서만 의미가 있으므로 제외)
+            stack.extend(child for child in reversed(element.children)
+                         if not isinstance(child, str))
+
+    def _emit_heading(self, element, story, styles, korean_styles):
+        """헤더 요소"""
+        style_name = f'Heading{element.tag[1]}'
+        text = self._get_element_text(element)
+        if text:
+            # 한글 폰트가 등록된 경우 미리 만든 스타일 사용
+            if self.korean_font_registered:
+                para = Paragraph(text, korean_styles[style_name])
+            else:
+                para = Paragraph(text, styles[style_name])
+            story.append(para)
+            story.append(Spacer(1, 12))
+
+    def _emit_paragraph(self, element, story, styles, korean_styles):
+        """단락 요소"""
+        text = self._get_element_text(element)
+        if text:
+            # 한글 폰트가 등록된 경우 미리 만든 스타일 사용
+            if self.korean_font_registered:
+                para = Paragraph(text, korean_styles['Normal'])
+            else:
+                para = Paragraph(text, styles['Normal'])
+            story.append(para)
+            story.append(Spacer(1, 6))
+
+    def _emit_br(self, element, story, styles, korean_styles):
+        """줄바꿈"""
+        story.append(Spacer(1, 12))
+
+    def _emit_hr(self, element, story, styles, korean_styles):
+        """수평선"""
+        story.append(Spacer(1, 6))
+        # 간단한 선 그리기 (reportlab의 다른 방법 필요)
+        story.append(Spacer(1, 6))
+
+    # 태그 → 핸들러 디스패치 테이블 (등록되지 않은 태그는 자식 순회)
+    _HANDLERS: ClassVar[dict] = {
+        **dict.fromkeys(sorted(_HEADING_TAGS), _emit_heading),
+        'p': _emit_paragraph,
+        'br': _emit_br,
+        'hr': _emit_hr,
+    }
     
     def _get_element_text(self, element):
         """요소의 모든 텍스트 내용 반환"""
-        text_parts = []
-        
-        if element.tag == 'text':
-            return element.content
-        
-        for child in element.children:
-            if child.tag == 'text':
-                text_parts.append(child.content)
-            else:
-                child_text = self._get_element_text(child)
-                if child_text:
-                    # 간단한 HTML 태그 처리
-                    if child.tag == 'strong' or child.tag == 'b':
-                        text_parts.append(f'<b>{child_text}</b>')
-                    elif child.tag == 'em' or child.tag == 'i':
-                        text_parts.append(f'<i>{child_text}</i>')
-                    else:
-                        text_parts.append(child_text)
-        
-        return ' '.join(text_parts)
+        if isinstance(element, str):
+            return element
+
+        # (요소, 자식 이터레이터, 수집된 조각) 프레임 스택으로 재귀 제거
+        stack = [(element, iter(element.children), [])]
+        while True:
+            node, children, text_parts = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                if isinstance(child, str):
+                    text_parts.append(child)
+                else:
+                    stack.append((child, iter(child.children), []))
+                continue
+
+            stack.pop()
+            text = ' '.join(text_parts)
+            if not stack:
+                return text
+            if text:
+                # 간단한 HTML 태그 처리
+                if node.tag == 'strong' or node.tag == 'b':
+                    text = f'<b>{text}</b>'
+                elif node.tag == 'em' or node.tag == 'i':
+                    text = f'<i>{text}</i>'
+                stack[-1][2].append(text)
     
     def html_to_pdf(self, html_content, output_path):
         """HTML을 PDF로 변환"""
@@ -365,19 +631,13 @@ class MiniWeasyPrint:
             self.apply_styles(document)
             
             # PDF 생성
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=self.page_size,
-                rightMargin=self.margin,
-                leftMargin=self.margin,
-                topMargin=self.margin,
-                bottomMargin=self.margin
-            )
-            
-            styles = getSampleStyleSheet()
+            doc = self._make_doc(output_path)
+
+            styles = _sample_styles_singleton()
+            korean_styles = self._build_korean_styles(styles)
             story = []
-            
-            self._add_elements_to_story(document, story, styles)
+
+            self._add_elements_to_story(document, story, styles, korean_styles)
             
             # PDF 빌드
             doc.build(story)
@@ -399,6 +659,54 @@ class MiniWeasyPrint:
             print(f"HTML 파일 읽기 오류: {e}")
             return False
 
+    async def convert_many(self, jobs, max_inflight=None):
+        """여러 (html 경로, pdf 경로) 작업을 동시에 변환
+
+        파일 읽기는 비동기(aiofiles 또는 스레드)로, CPU가 많이 드는
+        PDF 빌드는 프로세스 풀로 겹쳐 실행해 코어 수에 비례해
+        확장된다. max_inflight로 동시에 진행되는 작업 수를 제한한다
+        (기본값: CPU 코어 수). 작업 순서대로 성공 여부 목록을 반환한다.
+        """
+        loop = asyncio.get_running_loop()
+        if max_inflight is None:
+            max_inflight = os.cpu_count() or 1
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        with ProcessPoolExecutor(max_workers=max_inflight) as pool:
+
+            async def convert_one(html_file_path, output_path):
+                async with semaphore:
+                    try:
+                        if AIOFILES_AVAILABLE:
+                            async with aiofiles.open(
+                                    html_file_path, 'r', encoding='utf-8') as f:
+                                html_content = await f.read()
+                        else:
+                            html_content = await loop.run_in_executor(
+                                None, _read_text_file, html_file_path)
+                        return await loop.run_in_executor(
+                            pool, _build_pdf, html_content, output_path)
+                    except Exception as e:
+                        print(f"일괄 변환 오류 ({html_file_path}): {e}")
+                        return False
+
+            return await asyncio.gather(
+                *(convert_one(src, dst) for src, dst in jobs))
+
+def _read_text_file(path):
+    """UTF-8 텍스트 파일 읽기 (스레드 풀에서 호출)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _build_pdf(html_content, output_path):
+    """프로세스 풀 워커에서 실행되는 단일 변환
+
+    reportlab의 전역 상태(폰트 레지스트리 등)는 빌드 간 공유가
+    안전하지 않으므로 워커마다 새 MiniWeasyPrint를 만든다.
+    """
+    converter = MiniWeasyPrint()
+    return converter.html_to_pdf(html_content, output_path)
+
 def main():
     """명령줄 인터페이스"""
     parser = argparse.ArgumentParser(description='Mini WeasyPrint - 경량 HTML to PDF 변환기')
@@ -413,7 +721,7 @@ def main():
     page_size = A4 if args.page_size == 'A4' else letter
     
     # 변환 실행
-    converter = MiniWeasyPrint()
+    converter = MiniWeasyPrint(verbose=True)
     converter.page_size = page_size
     
     success = converter.html_file_to_pdf(args.input, args.output)
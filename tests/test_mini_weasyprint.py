@@ -0,0 +1,56 @@
+"""Test the mini_weasyprint fallback HTML parser."""
+
+from mini_weasyprint import _FEED_CHUNK_SIZE, CSSParser, MiniHTMLParser
+
+
+def parse_chunked(html):
+    # Feed in the same fixed-size slices as MiniWeasyPrint.parse_html.
+    parser = MiniHTMLParser(CSSParser())
+    for i in range(0, len(html), _FEED_CHUNK_SIZE):
+        parser.feed(html[i:i + _FEED_CHUNK_SIZE])
+    parser.close()
+    return parser
+
+
+def find_element(document, tag):
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, str):
+            if node.tag == tag:
+                return node
+            stack.extend(node.children)
+
+
+def test_text_run_across_feed_boundary():
+    # A single text run larger than one feed chunk must stay one child,
+    # not get split and independently stripped at the chunk boundary.
+    text = 'word ' * (_FEED_CHUNK_SIZE // 4)
+    paragraph = find_element(parse_chunked(f'<p>{text}</p>').document, 'p')
+    assert paragraph.children == [text.strip()]
+
+
+def test_feed_boundary_on_space():
+    # A chunk boundary landing exactly on a space must not glue the
+    # surrounding words together.
+    html = '<p>' + 'a' * (_FEED_CHUNK_SIZE - 8) + ' hello world</p>'
+    paragraph = find_element(parse_chunked(html).document, 'p')
+    assert paragraph.get_text().endswith(' hello world')
+
+
+def test_comment_splits_text_run():
+    # A comment ends the current run like the C parser path does, so the
+    # two halves stay separate children instead of merging into one word.
+    paragraph = find_element(
+        parse_chunked('<p>foo<!-- c -->bar</p>').document, 'p')
+    assert paragraph.children == ['foo', 'bar']
+
+
+def test_style_across_feed_boundary():
+    # <style> content is CDATA and buffered by the parser itself; rules
+    # crossing a chunk boundary must still reach the CSS parser intact.
+    css = ''.join(f'.c{i}{{color:red}}' for i in range(5000))
+    assert len(css) > _FEED_CHUNK_SIZE
+    parser = parse_chunked(f'<style>{css}</style><p>x</p>')
+    assert parser.css_parser.styles['.c0'] == {'color': 'red'}
+    assert parser.css_parser.styles['.c4999'] == {'color': 'red'}